@@ -81,6 +81,18 @@ TEST(Broadcast, SimplifyBroadcastDims) {
   TestSimplifyBroadcastDims<max_num_dims>(
       num_src0_dims_3, src0_dims_3, num_src1_dims_3, src1_dims_3, simplified_num_dims_3,
       simplified_src0_dims_3, simplified_src1_dims_3, simplified_dst_dims_3);
+
+  const size_t num_src0_dims_4 = 5;
+  const size_t num_src1_dims_4 = 5;
+  int64_t src0_dims_4[max_num_dims]{1, 1, 256, 8, 256};
+  int64_t src1_dims_4[max_num_dims]{1, 128, 1, 1, 256};
+  const size_t simplified_num_dims_4 = 3;
+  int64_t simplified_src0_dims_4[max_num_dims]{1, 2048, 256};
+  int64_t simplified_src1_dims_4[max_num_dims]{128, 1, 256};
+  int64_t simplified_dst_dims_4[max_num_dims]{128, 2048, 256};
+  TestSimplifyBroadcastDims<max_num_dims>(
+      num_src0_dims_4, src0_dims_4, num_src1_dims_4, src1_dims_4, simplified_num_dims_4,
+      simplified_src0_dims_4, simplified_src1_dims_4, simplified_dst_dims_4);
 }
 
 }  // namespace
@@ -82,6 +82,13 @@ class BroadcastElementwiseBinaryImpl : public BroadcastElementwiseBinary {
                                        simplified_dst_dims);
     CheckInplace(num_dims, simplified_src0_dims, src0, simplified_src1_dims, src1,
                  simplified_dst_dims, dst);
+    if (num_dims == 1 && simplified_src0_dims[0] == simplified_src1_dims[0]) {
+      // Same-shape operands are a flat contiguous loop that the compiler vectorizes, there is
+      // no need to build the ndarray shapes.
+      LaunchElementwise(stream, simplified_dst_dims[0], reinterpret_cast<const Src*>(src0),
+                        reinterpret_cast<const Src*>(src1), reinterpret_cast<Dst*>(dst));
+      return;
+    }
     for (int64_t i = 0; i < num_dims; ++i) {
       src0_dim_vec.push_back(simplified_src0_dims[i]);
       src1_dim_vec.push_back(simplified_src1_dims[i]);
@@ -93,6 +100,16 @@ class BroadcastElementwiseBinaryImpl : public BroadcastElementwiseBinary {
         XpuVarNdarray<const Src>(Shape(src1_dim_vec), reinterpret_cast<const Src*>(src1),
                                  num_dims));
   }
+
+ private:
+  static void LaunchElementwise(Stream* stream, int64_t elem_cnt, const Src* src0, const Src* src1,
+                                Dst* dst) {
+    stream->As<CpuStream>()->ParallelFor(
+        0, elem_cnt, [src0, src1, dst](int64_t begin, int64_t end) {
+          BinaryFunctor<DeviceType::kCPU, binary_op, Src, Dst> functor;
+          for (int64_t i = begin; i < end; ++i) { dst[i] = functor(src0[i], src1[i]); }
+        });
+  }
 };
 
 template<BinaryOp binary_op, typename Src, typename Dst,
@@ -152,6 +152,22 @@ class ScalarAddFunctor : public ScalarMathBaseFunctor {
   }
 };
 
+namespace {
+
+// Whether `scalar` can be added in place into `tmp`, a temporary derived from `src`. This is not
+// the case when the producer short-circuited and returned `src` itself, when the scalar would
+// promote the tensor's dtype, or for global tensors: scalar_mul keeps partial_sum but scalar_add
+// has no P signature, so the result would be written back under a stale sbp.
+bool CanAddScalarInplace(const std::shared_ptr<one::Tensor>& tmp,
+                         const std::shared_ptr<one::Tensor>& src, const Scalar& scalar) {
+  if (tmp == src || !tmp->is_local()) { return false; }
+  const DataType data_type = tmp->dtype()->data_type();
+  if (data_type == DataType::kBool) { return false; }
+  return !(scalar.IsFloatingPoint() && IsIntegralDataType(data_type));
+}
+
+}  // namespace
+
 class ScalarAdd2Functor {
  public:
   Maybe<Tensor> operator()(const Scalar& input, const std::shared_ptr<one::Tensor>& other,
@@ -161,15 +177,14 @@ class ScalarAdd2Functor {
       return Error::RuntimeError()
              << "For integral input tensors, argument alpha must not be a floating point number.";
     }
-    std::shared_ptr<one::Tensor> other_;
     if ((alpha.IsIntegral() && alpha.Value<int64_t>() == 1)
         || (alpha.IsFloatingPoint()
             && std::fabs(alpha.Value<double>() - 1.0) < std::numeric_limits<double>::epsilon())) {
-      other_ = other;
-    } else {
-      other_ = JUST(ScalarMul(alpha, other));
+      return ScalarAdd(other, input, /*alpha=*/1, /*inplace=*/false);
     }
-    return ScalarAdd(other_, input, /*alpha=*/1, /*inplace=*/false);
+    const auto scaled = JUST(ScalarMul(alpha, other));
+    return ScalarAdd(scaled, input, /*alpha=*/1,
+                     /*inplace=*/CanAddScalarInplace(scaled, other, input));
   }
 };
 
@@ -184,8 +199,10 @@ class ScalarSubFunctor {
 class ScalarSub2Functor {
  public:
   Maybe<Tensor> operator()(const Scalar& scalar, const std::shared_ptr<one::Tensor>& x) const {
-    return ScalarAdd(JUST(ScalarMul(x, Scalar(-1), false)), scalar, /*alpha=*/1,
-                     /*inplace=*/false);
+    // scalar - x == (-x) + scalar, accumulated into the negated temporary when possible.
+    const auto negative_x = JUST(ScalarMul(x, Scalar(-1), false));
+    return ScalarAdd(negative_x, scalar, /*alpha=*/1,
+                     /*inplace=*/CanAddScalarInplace(negative_x, x, scalar));
   }
 };
 
@@ -235,6 +252,15 @@ class InplaceScalarDivFunctor : public ScalarMathBaseFunctor {
 class ScalarPowFunctor : public ScalarMathBaseFunctor {
  public:
   ScalarPowFunctor() : ScalarMathBaseFunctor(/*op_name=*/"scalar_pow") {}
+  Maybe<Tensor> operator()(const std::shared_ptr<one::Tensor>& x, const Scalar& scalar,
+                           bool inplace) const {
+    // x ** 2 is common enough to avoid calling pow for it.
+    if (!inplace && IsFloatingDataType(x->dtype()->data_type())
+        && JUST(scalar.As<double>()) == 2.0) {
+      return functional::Square(x);
+    }
+    return ScalarMathBaseFunctor::operator()(x, scalar, inplace);
+  }
 };
 
 class ScalarPowGradFunctor {
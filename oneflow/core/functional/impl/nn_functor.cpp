@@ -640,15 +640,15 @@ class MarginRankingLossFunctor : public LossFunctorBase {
                            const std::shared_ptr<one::Tensor>& input_2,
                            const std::shared_ptr<one::Tensor>& target, const float margin,
                            const std::string& reduction) const {
+    // margin - target * (input_1 - input_2) == target * (input_2 - input_1) + margin
     const auto out =
         sequence_function(functional::Sub)
-            .then(functional::Negative)
             .then(std::bind(functional::Mul, target, std::placeholders::_1))
             .then([&margin](const std::shared_ptr<one::Tensor>& x) {
               return functional::ScalarAdd(x, Scalar(margin), /*alpha=*/1, /*inplace=*/true);
             })
             .then(std::bind(functional::Clamp, std::placeholders::_1, Scalar(0), NullOpt))
-            .call(input_1, input_2, /*inplace=*/false);
+            .call(input_2, input_1, /*inplace=*/false);
     return apply_reduction(out, reduction);
   }
 };
@@ -779,14 +779,16 @@ class NllLossFunctor {
     MutableAttrMap attrs;
     JUST(attrs.SetAttr<int64_t>("ignore_index", ignore_index));
 
-    std::vector<int> input_perm(input_shape->dim_vec().size(), 0);
-    input_perm[input_perm.size() - 1] = 1;
-    for (size_t i = 1; i < input_perm.size() - 1; ++i) { input_perm[i] = i + 1; }
-
-    const auto input_ = JUST(sequence_function(functional::Transpose)
-                                 .then(std::bind(functional::Reshape, std::placeholders::_1,
-                                                 Shape({-1, input_shape->At(1)})))
-                                 .call(input, input_perm));
+    std::shared_ptr<Tensor> input_ = input;
+    if (input_shape->NumAxes() > 2) {
+      std::vector<int> input_perm(input_shape->dim_vec().size(), 0);
+      input_perm[input_perm.size() - 1] = 1;
+      for (size_t i = 1; i < input_perm.size() - 1; ++i) { input_perm[i] = i + 1; }
+      input_ = JUST(sequence_function(functional::Transpose)
+                        .then(std::bind(functional::Reshape, std::placeholders::_1,
+                                        Shape({-1, input_shape->At(1)})))
+                        .call(input, input_perm));
+    }
     auto target_ = JUST(functional::Flatten(target, 0, target_shape->NumAxes() - 1));
 
     std::shared_ptr<TensorTuple> kernel_result;
@@ -841,17 +843,19 @@ class CrossEntropyFunctor {
     MutableAttrMap attrs;
     JUST(attrs.SetAttr<int64_t>("ignore_index", ignore_index));
 
-    std::vector<int> input_perm(input_shape->dim_vec().size(), 0);
-    input_perm[input_perm.size() - 1] = 1;
-    for (size_t i = 1; i < input_perm.size() - 1; ++i) { input_perm[i] = i + 1; }
-
-    const auto input_ = JUST(sequence_function(functional::Transpose)
-                                 .then(std::bind(functional::Reshape, std::placeholders::_1,
-                                                 Shape({-1, input_shape->At(1)})))
-                                 .then([this](const std::shared_ptr<one::Tensor>& x) {
-                                   return OpInterpUtil::Dispatch<Tensor>(*op_log_softmax_, {x});
-                                 })
-                                 .call(input, input_perm));
+    // For (N, C) input the class axis is already the last one, so the transpose would be an
+    // identity copy and the reshape a no-op.
+    std::shared_ptr<Tensor> input_ = input;
+    if (input_shape->NumAxes() > 2) {
+      std::vector<int> input_perm(input_shape->dim_vec().size(), 0);
+      input_perm[input_perm.size() - 1] = 1;
+      for (size_t i = 1; i < input_perm.size() - 1; ++i) { input_perm[i] = i + 1; }
+      input_ = JUST(sequence_function(functional::Transpose)
+                        .then(std::bind(functional::Reshape, std::placeholders::_1,
+                                        Shape({-1, input_shape->At(1)})))
+                        .call(input, input_perm));
+    }
+    input_ = JUST(OpInterpUtil::Dispatch<Tensor>(*op_log_softmax_, {input_}));
 
     const auto target_ = JUST(functional::Flatten(target, 0, target->shape()->NumAxes() - 1));
 
@@ -1196,16 +1200,9 @@ class CtcLossFunctor {
     auto out = JUST(OpInterpUtil::Dispatch<Tensor>(
         *op_, {log_probs, targets, input_lengths, target_lengths}, attrs));
     if (zero_infinity) {
-      const auto create_constant = [&](const Scalar& scalar) -> Maybe<Tensor> {
-        return functional::Constant(*out->shape(), scalar, out->dtype(), JUST(out->device()));
-      };
-
-      out = JUST(sequence_function(functional::Constant)
-                     .then(std::bind(functional::BroadcastEqual, out, std::placeholders::_1))
-                     .then(std::bind(functional::Where, std::placeholders::_1,
-                                     JUST(create_constant(Scalar(0))), out))
-                     .call(*out->shape(), Scalar(std::numeric_limits<double>::infinity()),
-                           out->dtype(), JUST(out->device())));
+      const auto is_inf = JUST(
+          functional::ScalarLogicalEqual(out, Scalar(std::numeric_limits<double>::infinity())));
+      out = JUST(functional::MaskedFill(out, is_inf, Scalar(0.0)));
     }
     CHECK_OR_RETURN([&]() -> bool {
       if ((reduction != "none") && (reduction != "sum") && (reduction != "mean")) return false;
@@ -43,8 +43,7 @@ struct BinaryCrossEntropyWithLogitsFunctor<T, WeightType::kNone> {
   BinaryCrossEntropyWithLogitsFunctor() : zero_(GetZeroVal<T>()), one_(GetOneVal<T>()) {}
   __device__ __forceinline__ T operator()(T input_val, T target_val) const {
     const T max_val = -input_val < zero_ ? zero_ : -input_val;
-    return (one_ - target_val) * input_val + max_val
-           + (log(exp(-max_val) + exp(-input_val - max_val)));
+    return (one_ - target_val) * input_val + max_val + log1p(exp(-abs(input_val)));
   }
 };
 
@@ -57,8 +56,7 @@ struct BinaryCrossEntropyWithLogitsFunctor<T, WeightType::kPosWeight> {
     const T max_val = -input_val < zero_ ? zero_ : -input_val;
     const T pos_weight_processed_val = weight_val - target_val + one_;
     return (one_ - target_val) * input_val
-           + (pos_weight_processed_val
-              * (log(exp(-max_val) + exp(-input_val - max_val)) + max_val));
+           + (pos_weight_processed_val * (log1p(exp(-abs(input_val))) + max_val));
   }
 };
 
@@ -69,8 +67,7 @@ struct BinaryCrossEntropyWithLogitsFunctor<float, WeightType::kNone> {
   BinaryCrossEntropyWithLogitsFunctor() : zero_(0.f), one_(1.f) {}
   __device__ __forceinline__ float operator()(float input_val, float target_val) const {
     const float max_val = -input_val < zero_ ? zero_ : -input_val;
-    return (one_ - target_val) * input_val + max_val
-           + (__logf(__expf(-max_val) + __expf(-input_val - max_val)));
+    return (one_ - target_val) * input_val + max_val + log1pf(__expf(-fabsf(input_val)));
   }
 };
 
@@ -84,8 +81,7 @@ struct BinaryCrossEntropyWithLogitsFunctor<float, WeightType::kPosWeight> {
     const float max_val = -input_val < zero_ ? zero_ : -input_val;
     const float pos_weight_processed_val = weight_val - target_val + one_;
     return (one_ - target_val) * input_val
-           + (pos_weight_processed_val
-              * (__logf(__expf(-max_val) + __expf(-input_val - max_val)) + max_val));
+           + (pos_weight_processed_val * (log1pf(__expf(-fabsf(input_val))) + max_val));
   }
 };
 
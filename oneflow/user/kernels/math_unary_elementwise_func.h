@@ -99,6 +99,15 @@ struct RsqrtFunctor<double> {
 
 // float version
 
+template<>
+struct AbsFunctor<float> {
+  static OF_DEVICE_FUNC float Forward(const float x) { return MATH_FUNC_F(fabs, x); }
+
+  static OF_DEVICE_FUNC float Backward(const float x, const float dy) {
+    return x == 0.0f ? 0.0f : (x < 0.0f ? -dy : dy);
+  }
+};
+
 template<>
 struct AcosFunctor<float> {
   static OF_DEVICE_FUNC float Forward(const float x) { return MATH_FUNC_F(acos, x); }
@@ -379,6 +388,15 @@ struct TanFunctor<float> {
 
 // double version
 
+template<>
+struct AbsFunctor<double> {
+  static OF_DEVICE_FUNC double Forward(const double x) { return MATH_FUNC_D(fabs, x); }
+
+  static OF_DEVICE_FUNC double Backward(const double x, const double dy) {
+    return x == 0.0 ? 0.0 : (x < 0.0 ? -dy : dy);
+  }
+};
+
 template<>
 struct AcosFunctor<double> {
   static OF_DEVICE_FUNC double Forward(const double x) { return MATH_FUNC_D(acos, x); }
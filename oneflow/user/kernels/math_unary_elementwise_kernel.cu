@@ -18,20 +18,21 @@ limitations under the License.
 #include "oneflow/core/kernel/cuda_graph_support.h"
 #include "oneflow/core/ep/cuda/cuda_stream.h"
 #include "oneflow/core/device/cuda_util.h"
+#include "oneflow/core/cuda/elementwise.cuh"
 
 namespace oneflow {
 
 namespace {
 
 template<template<typename> class UnaryFunctor, typename T>
-__global__ void MathUnaryElementwiseForwardGpu(const int n, const T* x, T* y) {
-  CUDA_1D_KERNEL_LOOP(i, n) { y[i] = UnaryFunctor<T>::Forward(x[i]); }
-}
+struct MathUnaryElementwiseForwardFunctor {
+  __device__ T operator()(T x) const { return UnaryFunctor<T>::Forward(x); }
+};
 
 template<template<typename> class UnaryFunctor, typename T>
-__global__ void MathUnaryElementwiseBackwardGpu(const int n, const T* x, const T* dy, T* dx) {
-  CUDA_1D_KERNEL_LOOP(i, n) { dx[i] = UnaryFunctor<T>::Backward(x[i], dy[i]); }
-}
+struct MathUnaryElementwiseBackwardFunctor {
+  __device__ T operator()(T x, T dy) const { return UnaryFunctor<T>::Backward(x, dy); }
+};
 
 }  // namespace
 
@@ -52,9 +53,9 @@ class MathUnaryElementwiseGpuKernel final : public user_op::OpKernel,
     int64_t n = tensor_x->shape().elem_cnt();
     CHECK_LE(n, GetMaxVal<int32_t>() / 2);
     if (n == 0) { return; }
-    MathUnaryElementwiseForwardGpu<UnaryFunctor, T>
-        <<<BlocksNum4ThreadsNum(n), kCudaThreadsNumPerBlock, 0,
-           ctx->stream()->As<ep::CudaStream>()->cuda_stream()>>>(n, x, y);
+    OF_CUDA_CHECK(cuda::elementwise::Unary(MathUnaryElementwiseForwardFunctor<UnaryFunctor, T>(), n,
+                                           y, x,
+                                           ctx->stream()->As<ep::CudaStream>()->cuda_stream()));
   }
   bool AlwaysComputeWhenAllOutputsEmpty() const override { return false; }
 };
@@ -79,9 +80,9 @@ class MathUnaryElementwiseGradGpuKernel final : public user_op::OpKernel,
     int64_t n = tensor_x->shape().elem_cnt();
     CHECK_LE(n, GetMaxVal<int32_t>() / 2);
     if (n == 0) { return; }
-    MathUnaryElementwiseBackwardGpu<UnaryFunctor, T>
-        <<<BlocksNum4ThreadsNum(n), kCudaThreadsNumPerBlock, 0,
-           ctx->stream()->As<ep::CudaStream>()->cuda_stream()>>>(n, x, dy, dx);
+    OF_CUDA_CHECK(cuda::elementwise::Binary(MathUnaryElementwiseBackwardFunctor<UnaryFunctor, T>(),
+                                            n, dx, x, dy,
+                                            ctx->stream()->As<ep::CudaStream>()->cuda_stream()));
   }
   bool AlwaysComputeWhenAllOutputsEmpty() const override { return false; }
 };
@@ -128,9 +129,9 @@ class MathUnaryElementwiseGpuHalfKernel final : public user_op::OpKernel,
     int64_t n = tensor_x->shape().elem_cnt();
     CHECK_LE(n, GetMaxVal<int32_t>() / 2);
     if (n == 0) { return; }
-    MathUnaryElementwiseForwardGpu<UnaryFunctor, half>
-        <<<BlocksNum4ThreadsNum(n), kCudaThreadsNumPerBlock, 0,
-           ctx->stream()->As<ep::CudaStream>()->cuda_stream()>>>(n, x, y);
+    OF_CUDA_CHECK(cuda::elementwise::Unary(MathUnaryElementwiseForwardFunctor<UnaryFunctor, half>(),
+                                           n, y, x,
+                                           ctx->stream()->As<ep::CudaStream>()->cuda_stream()));
   }
   bool AlwaysComputeWhenAllOutputsEmpty() const override { return false; }
 };
@@ -155,9 +156,9 @@ class MathUnaryElementwiseGradGpuHalfKernel final : public user_op::OpKernel,
     int64_t n = tensor_x->shape().elem_cnt();
     CHECK_LE(n, GetMaxVal<int32_t>() / 2);
     if (n == 0) { return; }
-    MathUnaryElementwiseBackwardGpu<UnaryFunctor, half>
-        <<<BlocksNum4ThreadsNum(n), kCudaThreadsNumPerBlock, 0,
-           ctx->stream()->As<ep::CudaStream>()->cuda_stream()>>>(n, x, dy, dx);
+    OF_CUDA_CHECK(
+        cuda::elementwise::Binary(MathUnaryElementwiseBackwardFunctor<UnaryFunctor, half>(), n, dx,
+                                  x, dy, ctx->stream()->As<ep::CudaStream>()->cuda_stream()));
   }
   bool AlwaysComputeWhenAllOutputsEmpty() const override { return false; }
 };
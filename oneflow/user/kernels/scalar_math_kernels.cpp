@@ -14,20 +14,27 @@ See the License for the specific language governing permissions and
 limitations under the License.
 */
 #include "oneflow/user/kernels/scalar_math_kernels.h"
+#include "oneflow/core/ep/cpu/cpu_stream.h"
 
 namespace oneflow {
 
 template<template<typename> class BIN_OP, typename T>
 struct ScalarMathFunctor<DeviceType::kCPU, BIN_OP, T> final {
   void operator()(ep::Stream* stream, const int64_t elem_cnt, const T scalar, const T* in, T* out) {
-    DoScalarMath<BIN_OP, T>(elem_cnt, scalar, in, out);
+    stream->As<ep::CpuStream>()->ParallelFor(
+        0, elem_cnt, [scalar, in, out](int64_t begin, int64_t end) {
+          DoScalarMath<BIN_OP, T>(end - begin, scalar, in + begin, out + begin);
+        });
   }
 };
 
 template<template<typename> class BIN_OP, typename T>
 struct ScalarReverseMathFunctor<DeviceType::kCPU, BIN_OP, T> final {
   void operator()(ep::Stream* stream, const int64_t elem_cnt, const T scalar, const T* in, T* out) {
-    DoScalarReverseMath<BIN_OP, T>(elem_cnt, scalar, in, out);
+    stream->As<ep::CpuStream>()->ParallelFor(
+        0, elem_cnt, [scalar, in, out](int64_t begin, int64_t end) {
+          DoScalarReverseMath<BIN_OP, T>(end - begin, scalar, in + begin, out + begin);
+        });
   }
 };
 
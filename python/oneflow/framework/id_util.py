@@ -15,6 +15,4 @@ limitations under the License.
 """
 import oneflow._oneflow_internal
 
-
-def UniqueStr(prefix):
-    return oneflow._oneflow_internal.UniqueStr(prefix)
+UniqueStr = oneflow._oneflow_internal.UniqueStr
@@ -224,7 +224,7 @@ def _mul_(self, other):
 
 
 def _rmul(self, other):
-    return self.mul(other)
+    return flow._C.mul(self, other)
 
 
 def _add(self, other):
@@ -240,11 +240,11 @@ def _add_inplace(self, other):
 
 
 def _iadd(self, other):
-    return self.add_(other)
+    return flow._C.add(self, other, inplace=True)
 
 
 def _radd(self, other):
-    return flow.add(self, other)
+    return flow._C.add(self, other)
 
 
 def _sub(self, other):
@@ -268,7 +268,7 @@ def _truediv_inplace(self, other):
 
 
 def _rtruediv(self, other):
-    return flow.div(other, self)
+    return flow._C.div(other, self)
 
 
 def _floor_divide(self, other):
@@ -993,10 +993,6 @@ def _to_consistent(self, *args, **kwargs):
 
 
 def RegisterMethods():
-    Tensor.__mul__ = lambda self, other: self.mul(other)
-    Tensor.__rmul__ = lambda self, other: self.mul(other)
-    Tensor.__add__ = lambda self, other: self.add(other)
-    Tensor.__iadd__ = lambda self, other: self.add_(other)
     Tensor.__matmul__ = lambda self, other: self.matmul(other)
     Tensor.ndim = property(_ndim)
     Tensor.numpy = _numpy
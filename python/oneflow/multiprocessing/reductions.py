@@ -34,12 +34,23 @@ except ImportError:
     pass
 
 
+# Tensors smaller than this are pickled inline, creating and unlinking a
+# shared memory segment costs more than copying them.
+_SHM_MIN_NBYTES = 64 * 1024
+
+
 def rebuild_empty_tensor(shape, dtype, requires_grad):
     t = flow.tensor([], dtype=dtype)
     t.requires_grad = requires_grad
     return t.reshape(*shape)
 
 
+def rebuild_numpy_tensor(arr, requires_grad):
+    t = flow.tensor(arr)
+    t.requires_grad = requires_grad
+    return t
+
+
 def rebuild_shm_tensor(shm, shape, dtype, requires_grad):
     def delete_shm():
         shm.close()
@@ -62,6 +73,10 @@ def rebuild_empty_parameter(shape, dtype, requires_grad):
     return Parameter(t, requires_grad=requires_grad)
 
 
+def rebuild_numpy_parameter(arr, requires_grad):
+    return Parameter(flow.tensor(arr), requires_grad=requires_grad)
+
+
 def rebuild_shm_parameter(shm, shape, dtype, requires_grad):
     def delete_shm():
         shm.close()
@@ -79,6 +94,8 @@ def reduce_tensor(tensor):
 
     if tensor_data.nbytes == 0:
         return (rebuild_empty_tensor, (tensor.shape, tensor.dtype, requires_grad))
+    elif tensor_data.nbytes < _SHM_MIN_NBYTES:
+        return (rebuild_numpy_tensor, (tensor_data, requires_grad))
     else:
         shm = shared_memory.SharedMemory(create=True, size=tensor_data.nbytes)
         shm_numpy = np.ndarray(
@@ -87,7 +104,7 @@ def reduce_tensor(tensor):
         shm_numpy[:] = tensor_data[:]
         return (
             rebuild_shm_tensor,
-            (shm, tensor_data.shape, tensor_data.dtype, requires_grad),
+            (shm, tensor_data.shape, tensor_data.dtype.str, requires_grad),
         )
 
 
@@ -96,7 +113,9 @@ def reduce_parameter(tensor):
     requires_grad = tensor.requires_grad
 
     if tensor_data.nbytes == 0:
-        return (rebuild_empty_parameter, (tensor, shape, tensor.dtype, requires_grad))
+        return (rebuild_empty_parameter, (tensor.shape, tensor.dtype, requires_grad))
+    elif tensor_data.nbytes < _SHM_MIN_NBYTES:
+        return (rebuild_numpy_parameter, (tensor_data, requires_grad))
     else:
         shm = shared_memory.SharedMemory(create=True, size=tensor_data.nbytes)
         shm_numpy = np.ndarray(
@@ -105,7 +124,7 @@ def reduce_parameter(tensor):
         shm_numpy[:] = tensor_data[:]
         return (
             rebuild_shm_parameter,
-            (shm, tensor_data.shape, tensor_data.dtype, requires_grad),
+            (shm, tensor_data.shape, tensor_data.dtype.str, requires_grad),
         )
 
 
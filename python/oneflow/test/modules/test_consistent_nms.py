@@ -23,24 +23,9 @@ from test_nms import create_tensors_with_iou
 from test_nms import nms_np
 
 
-def _test_nms(test_case, placement, sbp):
-    iou = 0.5
-    boxes, scores = create_tensors_with_iou(800, iou)
-
-    global_boxes = flow.tensor(boxes, dtype=flow.float32).to_global(
-        placement=flow.env.all_device_placement("cpu"), sbp=flow.sbp.broadcast
-    )
-    np_boxes = global_boxes.numpy()
+def _test_nms(test_case, placement, sbp, global_boxes, global_scores, iou, keep_np):
     global_boxes = global_boxes.to_global(placement=placement, sbp=sbp)
-
-    global_scores = flow.tensor(scores, dtype=flow.float32).to_global(
-        placement=flow.env.all_device_placement("cpu"), sbp=flow.sbp.broadcast
-    )
-    np_scores = global_scores.numpy()
     global_scores = global_scores.to_global(placement=placement, sbp=sbp)
-
-    keep_np = nms_np(np_boxes, np_scores, iou)
-
     keep = flow.nms(global_boxes, global_scores, iou)
     test_case.assertTrue(np.allclose(keep.numpy(), keep_np))
 
@@ -48,12 +33,25 @@ def _test_nms(test_case, placement, sbp):
 class TestNMS(flow.unittest.TestCase):
     @globaltest
     def test_nms(test_case):
+        iou = 0.5
+        boxes, scores = create_tensors_with_iou(800, iou)
+        # Broadcast the inputs once; every placement/sbp case below reuses them.
+        cpu_placement = flow.env.all_device_placement("cpu")
+        global_boxes = flow.tensor(boxes, dtype=flow.float32).to_global(
+            placement=cpu_placement, sbp=flow.sbp.broadcast
+        )
+        global_scores = flow.tensor(scores, dtype=flow.float32).to_global(
+            placement=cpu_placement, sbp=flow.sbp.broadcast
+        )
+        keep_np = nms_np(global_boxes.numpy(), global_scores.numpy(), iou)
         for placement in all_placement():
             # TODO: nms only has cuda kernel at now.
             if placement.type == "cpu":
                 continue
             for sbp in all_sbp(placement, max_dim=1):
-                _test_nms(test_case, placement, sbp)
+                _test_nms(
+                    test_case, placement, sbp, global_boxes, global_scores, iou, keep_np
+                )
 
 
 if __name__ == "__main__":
@@ -306,6 +306,20 @@ class TestTopk(flow.unittest.TestCase):
         )
         return y[0], y[1]
 
+    def test_flow_topk_smallest_with_integral_data(test_case):
+        arg_dict = OrderedDict()
+        arg_dict["device"] = ["cpu", "cuda"]
+        arg_dict["dtype"] = [flow.int8, flow.int32, flow.int64]
+        for device, dtype in GenArgList(arg_dict):
+            np_x = np.random.permutation(60).reshape(3, 4, 5)
+            x = flow.tensor(np_x, dtype=dtype, device=flow.device(device))
+            values, indices = flow.topk(x, 3, dim=1, largest=False)
+            np_indices = np.argsort(np_x, axis=1)[:, :3, :]
+            np_values = np.take_along_axis(np_x, np_indices, axis=1)
+            test_case.assertEqual(values.dtype, dtype)
+            test_case.assertTrue(np.array_equal(values.numpy(), np_values))
+            test_case.assertTrue(np.array_equal(indices.numpy(), np_indices))
+
 
 @flow.unittest.skip_unless_1n1d()
 class TestPow(flow.unittest.TestCase):
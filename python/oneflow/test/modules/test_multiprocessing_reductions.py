@@ -0,0 +1,65 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+from multiprocessing.reduction import ForkingPickler
+
+import numpy as np
+
+import oneflow as flow
+import oneflow.multiprocessing
+import oneflow.unittest
+
+
+def _pickle_round_trip(x):
+    return ForkingPickler.loads(ForkingPickler.dumps(x))
+
+
+def _check_round_trip(test_case, x, is_parameter):
+    y = _pickle_round_trip(x)
+    test_case.assertEqual(isinstance(y, flow.nn.Parameter), is_parameter)
+    test_case.assertEqual(y.dtype, x.dtype)
+    test_case.assertEqual(y.shape, x.shape)
+    test_case.assertEqual(y.requires_grad, x.requires_grad)
+    test_case.assertTrue(np.array_equal(y.numpy(), x.numpy()))
+
+
+@flow.unittest.skip_unless_1n1d()
+class TestMultiprocessingReductions(flow.unittest.TestCase):
+    def test_small_tensor(test_case):
+        x = flow.tensor(np.random.randn(4, 8).astype(np.float32), requires_grad=True)
+        _check_round_trip(test_case, x, is_parameter=False)
+        x = flow.tensor(np.arange(16, dtype=np.int64).reshape(2, 8))
+        _check_round_trip(test_case, x, is_parameter=False)
+
+    def test_small_parameter(test_case):
+        x = flow.nn.Parameter(flow.tensor(np.random.randn(3, 5).astype(np.float32)))
+        _check_round_trip(test_case, x, is_parameter=True)
+        x = flow.nn.Parameter(
+            flow.tensor(np.random.randn(3, 5).astype(np.float64)), requires_grad=False
+        )
+        _check_round_trip(test_case, x, is_parameter=True)
+
+    def test_empty_parameter(test_case):
+        x = flow.nn.Parameter(flow.tensor([], dtype=flow.float32).reshape(0, 3))
+        _check_round_trip(test_case, x, is_parameter=True)
+
+    def test_empty_tensor(test_case):
+        x = flow.tensor([], dtype=flow.int32).reshape(2, 0)
+        _check_round_trip(test_case, x, is_parameter=False)
+
+
+if __name__ == "__main__":
+    unittest.main()